@@ -0,0 +1,264 @@
+"""
+Testes Automáticos para o Template de Limpeza usando Pandas
+
+Este módulo contém testes para validar se o template de limpeza (transformation/to_silver/
+cleaning_template_pandas.py) está funcionando corretamente.
+
+ORIENTAÇÕES:
+- Cada teste monta um pequeno DataFrame em memória e executa clean_dataframe()
+  (ou clean_dataframe_chunked() sobre uma lista de blocos).
+- O teste verifica se:
+  - A limpeza termina sem erros.
+  - Valores ausentes foram preenchidos e outliers limitados.
+  - O DataFrame de entrada não foi alterado.
+
+INSTRUCTIONS:
+- Each test builds a small in-memory DataFrame and runs clean_dataframe()
+  (or clean_dataframe_chunked() over a list of chunks).
+- The test checks:
+  - Cleaning finishes without errors.
+  - Missing values were filled and outliers capped.
+  - The input DataFrame was not modified.
+
+Dependências / Dependencies:
+- pytest
+- pandas
+- numpy
+"""
+
+import io
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from transformation.to_silver import cleaning_template_pandas as cleaning
+
+
+def test_all_float_frame():
+    # Um bloco só float64 vira uma view somente leitura com Copy-on-Write
+    df = pd.DataFrame({'a': [1.0, np.nan, 3.0, 100.0], 'b': [0.5, 0.25, np.nan, 0.75]})
+    original = df.copy()
+
+    cleaned = cleaning.clean_dataframe(df)
+
+    assert cleaned.notna().all().all()
+    assert cleaned['a'].max() < 100.0
+    pd.testing.assert_frame_equal(df, original)
+
+def test_float_and_text_frame():
+    df = pd.DataFrame({'a': [1.0, np.nan, 3.0, 100.0], 's': ['x', 'y', None, 'x']})
+
+    cleaned = cleaning.clean_dataframe(df)
+
+    assert cleaned.notna().all().all()
+
+def test_date_text_column_is_filled_with_mode():
+    df = pd.DataFrame({
+        'd': ['2024-01-01', None, '2024-01-02', '2024-01-01', None],
+        'x': range(5),
+    })
+
+    cleaned = cleaning.clean_dataframe(df)
+
+    assert pd.api.types.is_datetime64_any_dtype(cleaned['d'])
+    assert cleaned['d'].isna().sum() == 0
+    assert (cleaned['d'].iloc[[1, 4]] == pd.Timestamp('2024-01-01')).all()
+
+def test_boolean_object_column_is_filled_with_mode():
+    # Booleanos também passam como números e datas; devem ser preenchidos com a moda como no original
+    df = pd.DataFrame({'flag': [True, False, None, True] * 10, 'x': range(40)})
+
+    cleaned = cleaning.clean_dataframe(df)
+    chunked = _clean_chunked(lambda: iter([df.iloc[:20], df.iloc[20:]]))
+
+    assert cleaned['flag'].dtype == bool
+    assert cleaned['flag'].tolist() == [True, False, True, True] * 10
+    assert chunked['flag'].tolist() == cleaned['flag'].tolist()
+
+def test_outlier_bounds_use_median_filled_column():
+    # Preenchida com a mediana: [1, 2, 3, 4, 1000] -> Q1 = 2, Q3 = 4, limite superior = 4 + 1.5 * 2 = 7
+    df = pd.DataFrame({'a': [1.0, 2.0, np.nan, 4.0, 1000.0]})
+
+    cleaned = cleaning.clean_dataframe(df)
+
+    assert cleaned['a'].tolist() == [1.0, 2.0, 3.0, 4.0, 7.0]
+
+def test_all_float_frame_numba_kernel(monkeypatch):
+    pytest.importorskip('numba')
+    monkeypatch.setattr(cleaning, '_NUMBA_MIN_SIZE', 0)
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(200, 3)), columns=['a', 'b', 'c'])
+    df.iloc[::7, 0] = np.nan
+    df.iloc[5, 1] = 1e6
+
+    # O kernel Numba só é usado pelo clean_dataframe_chunked, onde o preenchimento é feito junto com o limite
+    cleaned = _clean_chunked(lambda: iter([df.iloc[:100], df.iloc[100:]]))
+
+    assert cleaned.notna().all().all()
+    assert cleaned['b'].max() < 1e6
+
+def test_numba_kernel_matches_numpy():
+    pytest.importorskip('numba')
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame(rng.normal(size=(500, 4)))
+    df[df > 1.5] = np.nan
+    values = df.to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+    medians = np.nanmedian(values, axis=0)
+    lower_bound, upper_bound = np.full(4, -1.0), np.full(4, 1.0)
+
+    expected, expected_changed = values.copy(), np.zeros(4, dtype=bool)
+    cleaning._fill_and_clip_numpy(expected, medians, lower_bound, upper_bound, expected_changed)
+    changed = np.zeros(4, dtype=bool)
+    cleaning._fill_and_clip_numba(values, medians, lower_bound, upper_bound, changed)
+
+    np.testing.assert_array_equal(values, expected)
+    np.testing.assert_array_equal(changed, expected_changed)
+
+def test_concatenated_arrow_text_frame():
+    # pd.concat deixa colunas Arrow com vários chunks
+    pa = pytest.importorskip('pyarrow')
+    first = pd.DataFrame({'s': pd.array(['Alpha', 'BETA', None], dtype='string[pyarrow]'), 'n': [1, 2, 3]})
+    second = pd.DataFrame({'s': pd.array(['Gamma!', 'alpha'], dtype='string[pyarrow]'), 'n': [4, 5]})
+    df = pd.concat([first, second], ignore_index=True)
+    assert isinstance(pa.array(df['s'].array), pa.ChunkedArray)
+
+    cleaned = cleaning.clean_dataframe(df)
+
+    assert set(cleaned['s']) == {'alpha', 'beta', 'gamma'}
+
+def test_concatenated_default_text_frame():
+    # Com o pandas 3 o dtype str padrão já é baseado em Arrow
+    first = pd.DataFrame({'s': ['Alpha', 'BETA', None], 'n': [1, 2, 3]})
+    second = pd.DataFrame({'s': ['Gamma!', 'alpha'], 'n': [4, 5]})
+
+    cleaned = cleaning.clean_dataframe(pd.concat([first, second], ignore_index=True))
+
+    assert set(cleaned['s']) == {'alpha', 'beta', 'gamma'}
+
+def _clean_chunked(make_chunks):
+    return pd.concat(list(cleaning.clean_dataframe_chunked(make_chunks)), ignore_index=True)
+
+def test_chunked_empty_float_column_becomes_text():
+    # A coluna 's' é toda vazia (float) no primeiro bloco e texto no segundo
+    first = pd.DataFrame({'x': range(4), 's': [np.nan] * 4})
+    second = pd.DataFrame({'x': range(4, 8), 's': ['X1', 'X2', 'X1', 'X1']})
+
+    cleaned = _clean_chunked(lambda: iter([first, second]))
+
+    assert cleaned['s'].tolist() == ['x1'] * 5 + ['x2', 'x1', 'x1']
+
+def test_text_column_with_numbers_first_stays_text():
+    # As primeiras 128 linhas são números, mas a coluna inteira não é: nada vira NaN
+    df = pd.DataFrame({
+        'code': [str(i % 10) for i in range(200)] + [f'AB{i % 10}' for i in range(200)],
+        'x': range(400),
+    })
+
+    cleaned = cleaning.clean_dataframe(df)
+
+    assert cleaned['code'].notna().all()
+    assert set(cleaned['code'].astype(object)) == {str(i) for i in range(10)} | {f'ab{i}' for i in range(10)}
+
+def test_chunked_numeric_column_with_later_token():
+    # O 'n/a' aparece só no segundo bloco; como no clean_dataframe a coluna continua texto
+    first = pd.DataFrame({'n': [str(i % 20) for i in range(200)], 'x': range(200)})
+    second = pd.DataFrame({'n': ['5', 'n/a', '7'], 'x': range(200, 203)})
+
+    cleaned = _clean_chunked(lambda: iter([first, second]))
+    expected = cleaning.clean_dataframe(pd.concat([first, second], ignore_index=True))
+
+    assert not pd.api.types.is_numeric_dtype(cleaned['n'])
+    assert cleaned['n'].astype(object).tolist() == expected['n'].astype(object).tolist()
+    assert cleaned['n'].tolist()[:3] == ['0', '1', '2'] and cleaned['n'].iloc[201] == 'Other'
+
+def test_chunked_dedup_across_int_and_float_chunks():
+    # A coluna 'b' é int no primeiro bloco e float no segundo; a linha 3,3.0 ainda é duplicata
+    csv = "a,b\n1,1\n2,2\n3,3\n3,3\n4,\n3,3.0\n"
+
+    cleaned = _clean_chunked(lambda: pd.read_csv(io.StringIO(csv), chunksize=4))
+    expected = cleaning.clean_dataframe(pd.read_csv(io.StringIO(csv)))
+
+    assert cleaned['a'].tolist() == expected['a'].tolist() == [1, 2, 3, 4]
+    assert cleaned['b'].tolist() == expected['b'].tolist() == [1.0, 2.0, 3.0, 2.0]
+
+def test_seen_hashes_matches_set():
+    rng = np.random.default_rng(2)
+    seen, expected = cleaning._SeenHashes(), set()
+    for _ in range(200):
+        hashes = np.unique(rng.integers(0, 3000, size=rng.integers(0, 50)).astype(np.uint64))
+        found = seen.contains(hashes)
+
+        assert found.tolist() == [h in expected for h in hashes.tolist()]
+        seen.add(hashes[~found])
+        expected.update(hashes.tolist())
+
+def _mixed_frame(rows=600, seed=3):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'Value': np.where(rng.random(rows) < 0.1, np.nan, rng.normal(10, 2, rows)),
+        'Count': rng.integers(0, 20, rows),
+        'City': rng.choice(['São Paulo', 'rio ', 'RIO', 'Recife!', None, 'Rare'], rows, p=[.4, .2, .2, .13, .065, .005]),
+        'Day': rng.choice(['2024-01-01', '2024-02-01', None], rows),
+    })
+    df.loc[7, 'Value'] = 1e4
+    return pd.concat([df, df.iloc[:30]], ignore_index=True)
+
+def test_chunked_matches_in_memory():
+    df = _mixed_frame()
+    chunks = [df.iloc[i:i + 250] for i in range(0, len(df), 250)]
+
+    cleaned = _clean_chunked(lambda: iter(chunks))
+    expected = cleaning.clean_dataframe(df)
+
+    # O clean_dataframe reduz os tipos; os valores devem ser os mesmos
+    assert list(cleaned.columns) == list(expected.columns)
+    assert len(cleaned) == len(expected)
+    for col in ['value', 'count']:
+        np.testing.assert_allclose(cleaned[col], expected[col].astype(np.float64))
+    for col in ['city', 'day']:
+        assert cleaned[col].astype(object).tolist() == expected[col].astype(object).tolist()
+
+def test_validate_data_with_value_counts():
+    cleaned, value_counts = cleaning.clean_dataframe(_mixed_frame(), return_stats=True)
+
+    assert cleaning.validate_data(cleaned, value_counts) == cleaning.validate_data(cleaned)
+
+def test_negative_zero_is_a_duplicate():
+    df = pd.DataFrame({'a': [0.0, -0.0, 1.0]})
+
+    assert len(cleaning.clean_dataframe(df)) == len(df.drop_duplicates()) == 2
+
+def test_copy_on_write_option_is_not_changed():
+    # No pandas 2.x o Copy-on-Write só é habilitado durante a limpeza, nem na importação
+    if not cleaning._PANDAS_2:
+        pytest.skip('Copy-on-Write is always on in pandas >= 3.0')
+    code = (
+        "import pandas as pd; from transformation.to_silver import cleaning_template_pandas; "
+        "print(pd.get_option('mode.copy_on_write'))"
+    )
+    imported = subprocess.run(
+        [sys.executable, '-c', code], cwd=Path(__file__).parents[1], capture_output=True, text=True, check=True
+    )
+    assert imported.stdout.strip() == 'False'
+
+    df = pd.DataFrame({'a': [1.0, np.nan, 3.0], 's': ['x', None, 'x']})
+    with pd.option_context('mode.copy_on_write', False):
+        cleaning.clean_dataframe(df)
+        list(cleaning.clean_dataframe_chunked(lambda: iter([df.iloc[:2], df.iloc[2:]])))
+
+        assert pd.get_option('mode.copy_on_write') is False
+
+def test_wide_numeric_frame_duplicates():
+    # Frames largos e numéricos passam pelo hash de linhas; deve manter as mesmas linhas do drop_duplicates
+    rng = np.random.default_rng(4)
+    df = pd.DataFrame(rng.normal(size=(50, cleaning._HASH_DEDUP_MIN_COLUMNS)))
+    df.iloc[0] = 0.0
+    df = pd.concat([df, df.iloc[[3, 7]], -df.iloc[[0]]], ignore_index=True)
+
+    cleaned = cleaning.clean_dataframe(df)
+
+    assert len(cleaned) == len(df.drop_duplicates()) == 50
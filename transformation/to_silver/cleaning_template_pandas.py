@@ -17,6 +17,8 @@ Follow these guidelines when using this template:
    - Text cleaning: Add specific text cleaning rules for your case
    - Categories: Adjust the rare category threshold (currently 1%)
    - Sparse columns: Modify the missing value threshold (currently 70%)
+   - Data types: Floats are downcast to float32 (~7 significant digits) and text columns
+     with less than 50% unique values become categories; skip this step if you need float64
 
 3. BEST PRACTICES:
    - Always validate results after each cleaning step
@@ -39,6 +41,20 @@ Follow these guidelines when using this template:
    - Validate categorical variables are standardized
    - Review outlier treatment results
 
+6. MEMORY / COPY-ON-WRITE:
+   - The cleaning functions run under pandas Copy-on-Write (always on in pandas >= 3.0;
+     on pandas 2.x it is enabled only while they run, the global option is left alone)
+   - The input DataFrame is never copied up front: each step returns a new frame
+     and data is only duplicated when a column is actually modified
+   - The original DataFrame passed to clean_dataframe is left untouched
+
+7. LARGE DATASETS:
+   - For data that doesn't fit in memory use clean_dataframe_chunked with a function that
+     returns a new chunk iterator, e.g. lambda: pd.read_sql(query, engine, chunksize=100_000)
+   - Besides one chunk, memory grows with the unique rows (an 8-byte hash each) and the
+     distinct category and date values (one count each), not with the full rows
+   - From the command line: python cleaning_template_pandas.py input.csv output.csv --chunksize 100000
+
 [PT-BR]
 Guia do Template de Limpeza de Dados
 ----------------------------------
@@ -58,6 +74,8 @@ Siga estas diretrizes ao usar este template:
    - Limpeza de texto: Adicione regras específicas de limpeza para seu caso
    - Categorias: Ajuste o limite para categorias raras (atualmente 1%)
    - Colunas esparsas: Modifique o limite de valores ausentes (atualmente 70%)
+   - Tipos de dados: Floats são reduzidos para float32 (~7 dígitos significativos) e colunas de
+     texto com menos de 50% de valores únicos viram categorias; pule esta etapa se precisar de float64
 
 3. BOAS PRÁTICAS:
    - Sempre valide os resultados após cada etapa de limpeza
@@ -79,13 +97,120 @@ Siga estas diretrizes ao usar este template:
    - Confirme se não foram introduzidos nulos inesperados
    - Valide se as variáveis categóricas estão padronizadas
    - Revise os resultados do tratamento de outliers
+
+6. MEMÓRIA / COPY-ON-WRITE:
+   - As funções de limpeza rodam com o Copy-on-Write do pandas (sempre ativo no pandas >= 3.0;
+     no pandas 2.x é habilitado apenas enquanto elas rodam, a opção global não é alterada)
+   - O DataFrame de entrada nunca é copiado de início: cada etapa retorna um novo frame
+     e os dados só são duplicados quando uma coluna é de fato modificada
+   - O DataFrame original passado para clean_dataframe não é alterado
+
+7. GRANDES VOLUMES DE DADOS:
+   - Para dados que não cabem em memória use clean_dataframe_chunked com uma função que
+     retorna um novo iterador de blocos, ex.: lambda: pd.read_sql(query, engine, chunksize=100_000)
+   - Além de um bloco, a memória cresce com as linhas únicas (um hash de 8 bytes cada) e os
+     valores distintos de categorias e datas (uma contagem cada), não com as linhas inteiras
+   - Pela linha de comando: python cleaning_template_pandas.py entrada.csv saida.csv --chunksize 100000
 """
 
 import pandas as pd
 import numpy as np
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
+import os
+from typing import Callable, Iterable, Iterator
 import re
 
+# Copy-on-Write is the default from pandas 3.0 on; on pandas 2.x it is enabled only inside the
+# cleaning functions, so importing this module doesn't change the behavior of the caller's code
+# Copy-on-Write é o padrão a partir do pandas 3.0; no pandas 2.x é habilitado apenas dentro das
+# funções de limpeza, assim importar este módulo não muda o comportamento do código de quem o chama
+_PANDAS_2 = int(pd.__version__.split('.')[0]) < 3
+
+def _copy_on_write():
+    return pd.option_context('mode.copy_on_write', True) if _PANDAS_2 else nullcontext()
+
+# Byte translate table for column names: [a-z0-9] map to themselves, any other byte (including
+# every byte of a multi-byte UTF-8 character) to an underscore
+# Tabela de tradução de bytes para nomes de colunas: [a-z0-9] mapeiam para si mesmos, qualquer outro
+# byte (incluindo todos os bytes de um caractere UTF-8 multibyte) para underscore
+_COL_TABLE = bytes(c if chr(c) in 'abcdefghijklmnopqrstuvwxyz0123456789' else ord('_') for c in range(256))
+
+# Special characters removed from text columns
+# Caracteres especiais removidos das colunas de texto
+_SPECIAL_RE = re.compile(r'[^\w\s]')
+
+# Text columns use Arrow-backed strings when pyarrow is installed, so the .str methods
+# run as Arrow compute kernels over one contiguous buffer
+# Colunas de texto usam strings Arrow quando o pyarrow está instalado, assim os métodos .str
+# rodam como kernels do Arrow sobre um único buffer contíguo
+try:
+    import pyarrow  # noqa: F401
+    _TEXT_DTYPE = 'string[pyarrow]'
+    # Arrow's regex engine (RE2) treats \w and \s as ASCII only, so the Unicode classes are spelled out
+    # O motor de regex do Arrow (RE2) trata \w e \s apenas como ASCII, então as classes Unicode são explícitas
+    _SPECIAL_PATTERN = r'[^\p{L}\p{N}\p{Z}_\s]'
+except ImportError:
+    _TEXT_DTYPE = 'string[python]'
+    _SPECIAL_PATTERN = _SPECIAL_RE
+
+# Numba is optional (pip install numba): it JIT-compiles the numeric fill + clip loop of
+# clean_dataframe_chunked into a parallel native kernel. The first call pays the compilation
+# (about a second), so only blocks with at least _NUMBA_MIN_SIZE values use it; smaller blocks
+# take the NumPy path
+# Numba é opcional (pip install numba): compila (JIT) o loop numérico de preenchimento + limite do
+# clean_dataframe_chunked em um kernel nativo paralelo. A primeira chamada paga a compilação (cerca
+# de um segundo), então apenas blocos com pelo menos _NUMBA_MIN_SIZE valores o utilizam; blocos
+# menores seguem pelo NumPy
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+_NUMBA_MIN_SIZE = 1_000_000
+
+# clean_dataframe deduplicates frames with at least this many columns, mostly numeric, through a
+# 64-bit row hash; narrower or text-heavy frames use drop_duplicates
+# O clean_dataframe remove duplicatas de frames com pelo menos esse número de colunas, majoritariamente
+# numéricas, por um hash de 64 bits por linha; frames mais estreitos ou com muito texto usam drop_duplicates
+_HASH_DEDUP_MIN_COLUMNS = 32
+
+def _fill_and_clip_numpy(values, medians, lower_bound, upper_bound, changed):
+    missing = np.isnan(values)
+    changed[:] = (missing | (values < lower_bound) | (values > upper_bound)).any(axis=0)
+    np.copyto(values, medians, where=missing)
+    np.clip(values, lower_bound, upper_bound, out=values)
+
+if njit is not None:
+    # 'nnan' is left out of fastmath on purpose: the kernel relies on isnan to find missing values
+    # 'nnan' fica fora do fastmath de propósito: o kernel depende de isnan para achar valores ausentes
+    @njit(parallel=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+    def _fill_and_clip_numba(values, medians, lower_bound, upper_bound, changed):
+        for j in prange(values.shape[1]):
+            column_changed = False
+            for i in range(values.shape[0]):
+                value = values[i, j]
+                if np.isnan(value):
+                    value = medians[j]
+                    column_changed = True
+                capped = min(max(value, lower_bound[j]), upper_bound[j])
+                if capped != value:
+                    column_changed = True
+                values[i, j] = capped
+            changed[j] = column_changed
+
+def _fill_and_clip(values, medians, lower_bound, upper_bound, changed):
+    # Fills NaN with the column median and caps values to the bounds, in place; changed[j] tells
+    # whether column j was modified
+    # Preenche NaN com a mediana da coluna e limita os valores aos limites, no lugar; changed[j]
+    # indica se a coluna j foi modificada
+    if njit is not None and values.size >= _NUMBA_MIN_SIZE:
+        _fill_and_clip_numba(values, medians, lower_bound, upper_bound, changed)
+    else:
+        _fill_and_clip_numpy(values, medians, lower_bound, upper_bound, changed)
+
 def standardize_column_names(df: pd.DataFrame) -> pd.DataFrame:
     """
     Standardizes column names by converting to lowercase, replacing spaces and special characters
@@ -101,34 +226,286 @@ def standardize_column_names(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: DataFrame with standardized column names / DataFrame com nomes de colunas padronizados
     """
-    df = df.copy()
-    
-    # Function to clean individual column names
-    # Função para limpar nomes individuais de colunas
-    def clean_column_name(col: str) -> str:
-        col = col.lower()
-        col = re.sub(r'[^a-z0-9]', '_', col)
-        col = col.strip('_')
-        col = re.sub(r'_+', '_', col)
-        return col
-    
-    new_columns = [clean_column_name(col) for col in df.columns]
+    # Lowercase and map special characters to underscores with a translate table (no regex engine),
+    # then collapse runs of underscores into one and strip them from the ends
+    # Converter para minúsculas e mapear caracteres especiais para underscores com uma tabela de
+    # tradução (sem motor de regex), depois unir sequências de underscores e removê-los das pontas
+    cleaned = []
+    for col in df.columns:
+        translated = str(col).lower().encode('utf-8', 'replace').translate(_COL_TABLE).decode('ascii')
+        cleaned.append('_'.join(filter(None, translated.split('_'))))
     
     # Handle duplicate column names by adding numbers
     # Tratar nomes de colunas duplicados adicionando números
-    seen = {}
-    for i, col in enumerate(new_columns):
-        if col in seen:
-            counter = seen[col]
-            new_columns[i] = f"{col}_{counter}"
-            seen[col] += 1
-        else:
-            seen[col] = 1
+    seen = Counter()
+    new_columns = []
+    for col in cleaned:
+        new_columns.append(f"{col}_{seen[col]}" if seen[col] else col)
+        seen[col] += 1
+    
+    # Only the column labels change; with Copy-on-Write the data buffers are shared
+    # Apenas os rótulos mudam; com Copy-on-Write os buffers de dados são compartilhados
+    return df.set_axis(new_columns, axis=1)
+
+def _process_numeric(values: np.ndarray) -> tuple:
+    """
+    Fills missing values with the column median and caps outliers with the IQR method over one
+    float block. As in the column-by-column version, the quartiles are taken from the
+    median-filled column, so the block is filled first and then only clipped.
+    
+    [PT-BR]
+    Preenche valores ausentes com a mediana da coluna e limita outliers pelo método IQR sobre um
+    bloco float. Como na versão coluna a coluna, os quartis são calculados sobre a coluna
+    preenchida com a mediana, então o bloco é preenchido primeiro e depois apenas limitado.
+    
+    Args:
+        values (np.ndarray): 2-D float64 block, one column per variable (modified in place) /
+                             Bloco float64 2-D, uma coluna por variável (modificado no lugar)
+        
+    Returns:
+        tuple: The filled and capped block, and a boolean mask of the columns that changed /
+               O bloco preenchido e limitado, e uma máscara booleana das colunas alteradas
+    """
+    if values.size == 0:
+        return values, np.zeros(values.shape[1], dtype=bool)
     
-    df.columns = new_columns
+    medians = np.nanmedian(values, axis=0)
+    missing = np.isnan(values)
+    np.copyto(values, medians, where=missing)
+    
+    Q1, Q3 = np.percentile(values, [25, 75], axis=0)
+    IQR = Q3 - Q1
+    lower_bound = Q1 - 1.5 * IQR
+    upper_bound = Q3 + 1.5 * IQR
+    
+    # No NaN is left, so the column minimum and maximum tell which columns get capped
+    # Não resta NaN, então o mínimo e o máximo de cada coluna indicam quais colunas são limitadas
+    capped = (values.min(axis=0) < lower_bound) | (values.max(axis=0) > upper_bound)
+    if capped.any():
+        np.clip(values, lower_bound, upper_bound, out=values)
+    return values, missing.any(axis=0) | capped
+
+def _process_text(s: pd.Series) -> pd.Series:
+    """
+    Strips, lowercases and removes special characters from a text column in one chained pass.
+    
+    [PT-BR]
+    Remove espaços, converte para minúsculas e remove caracteres especiais de uma coluna de texto
+    em uma única passada encadeada.
+    
+    Args:
+        s (pd.Series): Text column / Coluna de texto
+        
+    Returns:
+        pd.Series: Cleaned column as a nullable string / Coluna limpa como string anulável
+    """
+    # The nullable string type keeps missing values missing instead of turning them into "nan"
+    # O tipo string anulável mantém valores ausentes como ausentes em vez de virarem "nan"
+    return (
+        s.astype(_TEXT_DTYPE)
+        .str.strip()
+        .str.lower()
+        .str.replace(_SPECIAL_PATTERN, '', regex=True)
+    )
+
+def _sniff_data_types(df: pd.DataFrame, sample_size: int = 128) -> dict:
+    """
+    Decides which text columns may hold numbers, dates or booleans by testing a small sample of
+    each, so the full column is only parsed when its sample parses.
+    
+    [PT-BR]
+    Decide quais colunas de texto podem conter números, datas ou booleanos testando uma pequena
+    amostra de cada uma, assim a coluna inteira só é convertida quando sua amostra é convertida.
+    
+    Args:
+        df (pd.DataFrame): Input DataFrame / DataFrame de entrada
+        sample_size (int): Non-null values tested per column / Valores não nulos testados por coluna
+        
+    Returns:
+        dict: Column name -> 'numeric', 'datetime' or 'boolean' /
+              Nome da coluna -> 'numeric', 'datetime' ou 'boolean'
+    """
+    conversions = {}
+    for col in df.select_dtypes(include=['object', 'string']).columns:
+        sample = df[col].dropna().head(sample_size)
+        if sample.empty:
+            continue
+        
+        # Booleans also parse as numbers (and as 1970 dates), so they are checked first
+        # Booleanos também são convertidos em números (e em datas de 1970), então são verificados primeiro
+        if pd.api.types.infer_dtype(sample) == 'boolean':
+            conversions[col] = 'boolean'
+        
+        # Try to convert to numeric
+        # Tentar converter para numérico
+        elif pd.to_numeric(sample, errors='coerce').notna().all():
+            conversions[col] = 'numeric'
+        
+        # Try to convert to datetime
+        # Tentar converter para datetime
+        elif pd.to_datetime(sample, errors='coerce', format='mixed').notna().all():
+            conversions[col] = 'datetime'
+    return conversions
+
+def _convert_data_types(df: pd.DataFrame, conversions: dict) -> pd.DataFrame:
+    """
+    Applies the conversions found by _sniff_data_types. A column with any value that can't be
+    parsed is left as text, as in the column-by-column version, so no value is lost to NaN/NaT.
+    
+    [PT-BR]
+    Aplica as conversões encontradas por _sniff_data_types. Uma coluna com algum valor que não pode
+    ser convertido é mantida como texto, como na versão coluna a coluna, assim nenhum valor vira NaN/NaT.
+    
+    Args:
+        df (pd.DataFrame): Input DataFrame / DataFrame de entrada
+        conversions (dict): Column name -> 'numeric', 'datetime' or 'boolean' /
+                            Nome da coluna -> 'numeric', 'datetime' ou 'boolean'
+        
+    Returns:
+        pd.DataFrame: DataFrame with converted columns / DataFrame com colunas convertidas
+    """
+    for col, kind in conversions.items():
+        parsed = _parse_column(df[col], kind)
+        if parsed is not None:
+            df[col] = parsed
     return df
 
-def clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+def _parse_column(s: pd.Series, kind: str):
+    # Parses the whole column, all or nothing: None when any value fails. Booleans become the
+    # nullable boolean, so missing values stay missing until they are filled with the mode
+    # Converte a coluna inteira, tudo ou nada: None quando algum valor falha. Booleanos viram o
+    # booleano anulável, assim valores ausentes continuam ausentes até serem preenchidos com a moda
+    try:
+        if kind == 'numeric':
+            return pd.to_numeric(s)
+        if kind == 'datetime':
+            return pd.to_datetime(s, format='mixed')
+        return s.astype('boolean')
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+def _replace_rare_categories(s: pd.Series, value_counts: pd.Series, total_rows: int) -> pd.Series:
+    """
+    Replaces categories with less than 1% of the rows by 'Other'. Missing values are kept.
+    
+    [PT-BR]
+    Substitui por 'Other' as categorias com menos de 1% das linhas. Valores ausentes são mantidos.
+    
+    Args:
+        s (pd.Series): Categorical column / Coluna categórica
+        value_counts (pd.Series): Count of each category / Contagem de cada categoria
+        total_rows (int): Number of rows the counts refer to / Número de linhas a que as contagens se referem
+        
+    Returns:
+        pd.Series: Column with rare categories replaced / Coluna com categorias raras substituídas
+    """
+    # Find rare categories (less than 1% of data)
+    # Encontrar categorias raras (menos de 1% dos dados)
+    is_rare = value_counts / total_rows < 0.01
+    if not is_rare.any():
+        return s
+    
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        # Categorical: merge the rare categories into 'Other' at the category level
+        # Categórica: unir as categorias raras em 'Other' no nível das categorias
+        if 'Other' not in s.cat.categories:
+            s = s.cat.add_categories('Other')
+        rare_categories = value_counts.index[is_rare].intersection(s.cat.categories).drop('Other', errors='ignore')
+        return s.cat.remove_categories(rare_categories).fillna('Other')
+    
+    # One hash-set membership test per cell keeps frequent values (and missing ones)
+    # Um teste de pertencimento por célula mantém os valores frequentes (e os ausentes)
+    frequent_categories = value_counts.index[~is_rare]
+    return s.where(s.isin(frequent_categories) | s.isna(), 'Other')
+
+def _map_columns(func: Callable[[pd.Series], pd.Series], df: pd.DataFrame, columns) -> list:
+    """
+    Applies a column transformation to each of the given columns, in a thread pool when there are
+    several columns and CPUs. Arrow string kernels and NumPy release the GIL, so the columns are
+    processed in parallel.
+    
+    [PT-BR]
+    Aplica uma transformação de coluna a cada uma das colunas informadas, em um pool de threads
+    quando há várias colunas e CPUs. Os kernels de string do Arrow e o NumPy liberam a GIL, assim
+    as colunas são processadas em paralelo.
+    
+    Args:
+        func (Callable): Function taking and returning a column / Função que recebe e retorna uma coluna
+        df (pd.DataFrame): Source DataFrame / DataFrame de origem
+        columns (list): Columns to transform / Colunas a serem transformadas
+        
+    Returns:
+        list: Transformed columns, in the given order / Colunas transformadas, na ordem informada
+    """
+    # Columns are taken here, so worker threads never index the DataFrame
+    # As colunas são obtidas aqui, assim as threads nunca indexam o DataFrame
+    series = [df[col] for col in columns]
+    if len(series) > 1 and (os.cpu_count() or 1) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(series), os.cpu_count())) as executor:
+            return list(executor.map(func, series))
+    return [func(s) for s in series]
+
+def _merge_rare_counts(value_counts: pd.Series, total_rows: int) -> pd.Series:
+    """
+    Applies the _replace_rare_categories rule to a value_counts Series: the counts of rare
+    categories are merged into 'Other' and categories without rows are dropped.
+    
+    [PT-BR]
+    Aplica a regra do _replace_rare_categories a uma Series de value_counts: as contagens das
+    categorias raras são unidas em 'Other' e categorias sem linhas são descartadas.
+    
+    Args:
+        value_counts (pd.Series): Count of each category / Contagem de cada categoria
+        total_rows (int): Number of rows the counts refer to / Número de linhas a que as contagens se referem
+        
+    Returns:
+        pd.Series: Counts after the replacement / Contagens após a substituição
+    """
+    is_rare = (value_counts / total_rows < 0.01).to_numpy()
+    labels = np.where(is_rare, 'Other', value_counts.index.astype(object))
+    merged = value_counts.groupby(labels, sort=False).sum()
+    return merged[merged > 0].sort_values(ascending=False)
+
+def _mode_from_counts(value_counts: pd.Series):
+    """
+    Returns the mode of a column from its value counts, the smallest value among ties as
+    Series.mode does, or "Unknown" when the column has no values.
+    
+    [PT-BR]
+    Retorna a moda de uma coluna a partir de suas contagens de valores, o menor valor entre
+    empates como o Series.mode, ou "Unknown" quando a coluna não tem valores.
+    """
+    if len(value_counts) == 0 or value_counts.iloc[0] == 0:
+        return "Unknown"
+    ties = value_counts.index[value_counts.to_numpy() == value_counts.iloc[0]]
+    try:
+        return ties.sort_values()[0]
+    except TypeError:
+        # Values of mixed types can't be ordered
+        # Valores de tipos diferentes não podem ser ordenados
+        return ties[0]
+
+def _compute_stats(df: pd.DataFrame, categorical_cols) -> dict:
+    """
+    Counts the values of each categorical column in one pass per column. clean_dataframe counts
+    once, after text cleaning, and keeps the counts up to date through the rare category
+    replacement, so rare categories and unique counts come from this single pass.
+    
+    [PT-BR]
+    Conta os valores de cada coluna categórica em uma passada por coluna. O clean_dataframe conta
+    uma vez, após a limpeza de texto, e mantém as contagens atualizadas durante a substituição de
+    categorias raras, assim categorias raras e contagens de únicos vêm dessa única passada.
+    
+    Args:
+        df (pd.DataFrame): Input DataFrame / DataFrame de entrada
+        categorical_cols (list): Columns to count / Colunas a serem contadas
+        
+    Returns:
+        dict: value_counts Series of each column / Series de value_counts de cada coluna
+    """
+    return dict(zip(categorical_cols, _map_columns(pd.Series.value_counts, df, categorical_cols)))
+
+def clean_dataframe(df: pd.DataFrame, return_stats: bool = False):
     """
     Performs comprehensive data cleaning on a pandas DataFrame
     
@@ -137,144 +514,601 @@ def clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     
     Args:
         df (pd.DataFrame): Input DataFrame to be cleaned / DataFrame de entrada a ser limpo
+        return_stats (bool): Also return the value counts of the categorical columns, which
+                             validate_data can reuse / Retornar também as contagens de valores das
+                             colunas categóricas, que o validate_data pode reutilizar
         
     Returns:
         pd.DataFrame: Cleaned DataFrame / DataFrame limpo
+        (pd.DataFrame, dict): Cleaned DataFrame and value counts, when return_stats is True /
+                              DataFrame limpo e contagens de valores, quando return_stats é True
     """
-    
-    # Create a copy to avoid modifying the original data
-    # Criar uma cópia para evitar modificar os dados originais
-    df_clean = df.copy()
+    with _copy_on_write():
+        return _clean_dataframe(df, return_stats)
+
+def _clean_dataframe(df: pd.DataFrame, return_stats: bool):
+    # Body of clean_dataframe, run under Copy-on-Write
+    # Corpo do clean_dataframe, executado com Copy-on-Write
     
     # Standardize column names (new step)
+    # No up-front copy: with Copy-on-Write the original data is never modified
     # Padronizar nomes de colunas (novo passo)
-    df_clean = standardize_column_names(df_clean)
-    
-    # 1. Remove duplicates
-    # 1. Remover duplicatas
-    df_clean = df_clean.drop_duplicates()
-    
-    # 2. Handle missing values
-    # 2. Tratar valores ausentes
-    def handle_missing_values(df):
-        # Fill numeric columns with median
-        # Preencher colunas numéricas com a mediana
-        numeric_cols = df.select_dtypes(include=['int64', 'float64']).columns
-        for col in numeric_cols:
-            df[col] = df[col].fillna(df[col].median())
-            
-        # Fill categorical columns with mode
-        # Preencher colunas categóricas com a moda
-        categorical_cols = df.select_dtypes(include=['object', 'category']).columns
-        for col in categorical_cols:
-            df[col] = df[col].fillna(df[col].mode()[0] if not df[col].mode().empty else "Unknown")
-            
-        return df
+    # Sem cópia inicial: com Copy-on-Write os dados originais nunca são modificados
+    df_clean = standardize_column_names(df)
+    
+    # 1. Remove duplicates (returns the first new frame)
+    # 1. Remover duplicatas (retorna o primeiro novo frame)
+    def remove_duplicates(df):
+        # drop_duplicates factorizes every column, which is fastest for text and narrow frames;
+        # only wide, mostly numeric frames gain from hashing each row first
+        # O drop_duplicates fatoriza cada coluna, o que é mais rápido para texto e frames estreitos;
+        # apenas frames largos e majoritariamente numéricos ganham ao hashear cada linha antes
+        numeric_cols = df.select_dtypes(include=['number', 'bool']).columns
+        if df.shape[1] < _HASH_DEDUP_MIN_COLUMNS or len(numeric_cols) < 0.9 * df.shape[1]:
+            return df.drop_duplicates()
+        
+        # Each row is reduced to one 64-bit hash, so wide rows are compared as a single uint64;
+        # adding 0.0 turns -0.0 into 0.0, which drop_duplicates treats as equal
+        # Cada linha é reduzida a um hash de 64 bits, assim linhas largas são comparadas como um único uint64;
+        # somar 0.0 transforma -0.0 em 0.0, que o drop_duplicates trata como iguais
+        float_cols = df.select_dtypes(include='float').columns
+        normalized = df.copy(deep=False)
+        normalized[float_cols] = df[float_cols] + 0.0
+        hashes = pd.util.hash_pandas_object(normalized, index=False)
+        duplicated = hashes.duplicated().to_numpy(copy=True)
+        
+        # Rows sharing a hash are compared by value, so a hash collision never drops a distinct row
+        # Linhas com o mesmo hash são comparadas pelo valor, assim uma colisão nunca descarta uma linha distinta
+        shared = hashes.duplicated(keep=False).to_numpy()
+        if shared.any():
+            duplicated[shared] = df[shared].duplicated().to_numpy()
+        return df[~duplicated]
+    
+    df_clean = remove_duplicates(df_clean)
+    
+    # 2. Remove columns with high percentage of missing values
+    # Runs before any filling, so every later step works on less data
+    # 2. Remover colunas com alta porcentagem de valores ausentes
+    # Executado antes de qualquer preenchimento, assim as etapas seguintes processam menos dados
+    def remove_sparse_columns(df, threshold=0.7):
+        if len(df) == 0:
+            return df
+        
+        # One reduction over the null mask gives the missing percentage of every column
+        # Uma redução sobre a máscara de nulos fornece a porcentagem de ausentes de todas as colunas
+        missing_percentages = df.isna().sum(axis=0).to_numpy() / len(df)
+        return df.loc[:, missing_percentages <= threshold]
     
-    df_clean = handle_missing_values(df_clean)
+    df_clean = remove_sparse_columns(df_clean)
     
     # 3. Fix data types
+    # Runs before filling, so columns converted to numbers get the numeric treatment
     # 3. Corrigir tipos de dados
-    def fix_data_types(df):
-        for col in df.columns:
-            # Try to convert to numeric
-            # Tentar converter para numérico
-            if df[col].dtype == 'object':
-                try:
-                    df[col] = pd.to_numeric(df[col])
-                except:
-                    pass
-                
-                # Try to convert to datetime
-                # Tentar converter para datetime
-                try:
-                    df[col] = pd.to_datetime(df[col])
-                except:
-                    pass
-        return df
+    # Executado antes do preenchimento, assim colunas convertidas para número recebem o tratamento numérico
+    def fix_data_types(df, sample_size=128):
+        # Sniff a small sample of each column first, then convert only the columns that will succeed
+        # Testar primeiro uma pequena amostra de cada coluna, depois converter apenas as que vão funcionar
+        return _convert_data_types(df, _sniff_data_types(df, sample_size))
     
     df_clean = fix_data_types(df_clean)
     
-    # 4. Handle outliers using IQR method for numeric columns
-    # 4. Tratar outliers usando o método IQR para colunas numéricas
-    def handle_outliers(df, columns=None):
-        if columns is None:
-            columns = df.select_dtypes(include=['int64', 'float64']).columns
-            
-        for col in columns:
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
+    # Select the column groups once; the following steps keep each column in its group
+    # Selecionar os grupos de colunas uma vez; as etapas seguintes mantêm cada coluna em seu grupo
+    numeric_cols = df_clean.select_dtypes(include='number', exclude='timedelta').columns
+    categorical_cols = df_clean.select_dtypes(include=['object', 'string', 'category']).columns
+    text_cols = df_clean.select_dtypes(include=['object', 'string']).columns
+    
+    bool_cols = df_clean.select_dtypes(include='bool').columns
+    
+    # Date and boolean columns are filled with the mode like the categorical ones
+    # Colunas de data e booleanas são preenchidas com a moda como as categóricas
+    mode_cols = categorical_cols.append(
+        [df_clean.select_dtypes(include=['datetime', 'datetimetz']).columns, bool_cols]
+    )
+    
+    # 4. Handle missing values and outliers
+    # 4. Tratar valores ausentes e outliers
+    def handle_missing_values(df, numeric_cols, mode_cols):
+        # Numeric columns: fill with median and cap outliers (IQR method) over one float block
+        # Only the columns that changed are written back, so the others keep their dtype
+        # Colunas numéricas: preencher com a mediana e limitar outliers (método IQR) sobre um bloco float
+        # Apenas as colunas alteradas são reescritas, as demais mantêm seu dtype
+        # copy=True: an all-float64 block is otherwise a read-only view under Copy-on-Write
+        # copy=True: caso contrário um bloco só float64 é uma view somente leitura com Copy-on-Write
+        if len(numeric_cols) > 0:
+            values, changed = _process_numeric(
+                df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+            )
+            if changed.any():
+                df[numeric_cols[changed]] = values[:, changed]
             
-            # Cap the outliers
-            # Limitar os outliers
-            df[col] = df[col].clip(lower=lower_bound, upper=upper_bound)
+        # Fill categorical, date and boolean columns with mode ("Unknown" when a column has no mode);
+        # only the columns with missing values are counted
+        # Preencher colunas categóricas, de data e booleanas com a moda ("Unknown" quando a coluna não tem moda);
+        # apenas as colunas com valores ausentes são contadas
+        missing = df[mode_cols].isna().any().to_numpy()
+        modes = {col: _mode_from_counts(df[col].value_counts()) for col in mode_cols[missing]}
+        df.fillna(modes, inplace=True)
         return df
     
-    df_clean = handle_outliers(df_clean)
+    df_clean = handle_missing_values(df_clean, numeric_cols, mode_cols)
     
     # 5. Standardize text data
     # 5. Padronizar dados de texto
-    def clean_text_data(df):
-        text_cols = df.select_dtypes(include=['object']).columns
+    def clean_text_data(df, text_cols):
+        for col, values in zip(text_cols, _map_columns(_process_text, df, text_cols)):
+            df[col] = values
+        return df
+    
+    df_clean = clean_text_data(df_clean, text_cols)
+    
+    # Count the categorical values once, on the cleaned (Arrow) text; the rare category check,
+    # the category downcast and validate_data reuse these counts
+    # Contar os valores categóricos uma vez, sobre o texto limpo (Arrow); a verificação de categorias
+    # raras, a conversão para category e o validate_data reutilizam essas contagens
+    value_counts = _compute_stats(df_clean, categorical_cols)
+    
+    # 6. Handle inconsistent categories
+    # 6. Tratar categorias inconsistentes
+    def standardize_categories(df, categorical_cols, value_counts):
+        # Replace rare categories (less than 1% of data) with 'Other'
+        # Substituir categorias raras (menos de 1% dos dados) por 'Other'
+        def standardize_column(s):
+            return _replace_rare_categories(s, value_counts[s.name], len(s))
         
-        for col in text_cols:
-            # Convert to string type
-            # Converter para tipo string
-            df[col] = df[col].astype(str)
-            
-            # Remove leading/trailing whitespace
-            # Remover espaços em branco no início/fim
-            df[col] = df[col].str.strip()
-            
-            # Convert to lowercase
-            # Converter para minúsculas
-            df[col] = df[col].str.lower()
-            
-            # Remove special characters
-            # Remover caracteres especiais
-            df[col] = df[col].apply(lambda x: re.sub(r'[^\w\s]', '', x))
+        for col, values in zip(categorical_cols, _map_columns(standardize_column, df, categorical_cols)):
+            df[col] = values
+            value_counts[col] = _merge_rare_counts(value_counts[col], len(df))
             
         return df
     
-    df_clean = clean_text_data(df_clean)
+    df_clean = standardize_categories(df_clean, categorical_cols, value_counts)
     
-    # 6. Remove columns with high percentage of missing values
-    # 6. Remover colunas com alta porcentagem de valores ausentes
-    def remove_sparse_columns(df, threshold=0.7):
-        missing_percentages = df.isnull().sum() / len(df)
-        columns_to_drop = missing_percentages[missing_percentages > threshold].index
-        return df.drop(columns=columns_to_drop)
+    # 7. Downcast data types to reduce memory usage
+    # 7. Reduzir os tipos de dados para diminuir o uso de memória
+    def optimize_dtypes(df, numeric_cols, text_cols, bool_cols, value_counts, category_threshold=0.5):
+        # Integer columns that were filled or capped are float by now
+        # Colunas inteiras que foram preenchidas ou limitadas já são float neste ponto
+        for col in numeric_cols:
+            downcast = 'integer' if pd.api.types.is_integer_dtype(df[col]) else 'float'
+            df[col] = pd.to_numeric(df[col], downcast=downcast)
+        
+        # Filled boolean columns no longer need the nullable mask
+        # Colunas booleanas preenchidas não precisam mais da máscara de nulos
+        for col in bool_cols:
+            if not df[col].hasnans:
+                df[col] = df[col].astype(bool)
+        
+        # Convert low-cardinality text columns to category
+        # Converter colunas de texto com baixa cardinalidade para category
+        for col in text_cols:
+            if len(df) > 0 and len(value_counts[col]) / len(df) < category_threshold:
+                df[col] = df[col].astype('category')
+        return df
     
-    df_clean = remove_sparse_columns(df_clean)
+    df_clean = optimize_dtypes(df_clean, numeric_cols, text_cols, bool_cols, value_counts)
+    
+    if return_stats:
+        return df_clean, value_counts
+    return df_clean
+
+def _column_kind(s: pd.Series) -> str:
+    """
+    Classifies a column into the group clean_dataframe treats it as: 'numeric', 'datetime',
+    'boolean', 'text', 'category' or 'other'. Text columns are sniffed for numbers, dates and
+    booleans first.
+    
+    [PT-BR]
+    Classifica uma coluna no grupo em que o clean_dataframe a trata: 'numeric', 'datetime',
+    'boolean', 'text', 'category' ou 'other'. Colunas de texto são testadas primeiro para números,
+    datas e booleanos.
+    
+    Args:
+        s (pd.Series): Column with at least one non-null value / Coluna com pelo menos um valor não nulo
+        
+    Returns:
+        str: Kind of the column / Tipo da coluna
+    """
+    if s.dtype == object or isinstance(s.dtype, pd.StringDtype):
+        return _sniff_data_types(s.to_frame()).get(s.name, 'text')
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        return 'category'
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return 'datetime'
+    if pd.api.types.is_bool_dtype(s):
+        return 'boolean'
+    if pd.api.types.is_numeric_dtype(s):
+        return 'numeric'
+    return 'other'
+
+def _row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """
+    Reduces each row to one 64-bit hash. Numbers are hashed by value, so 2 and 2.0 (an integer
+    column in one chunk that is float in another) and 0.0 and -0.0 hash alike, and missing values
+    hash alike whatever their dtype.
+    
+    [PT-BR]
+    Reduz cada linha a um hash de 64 bits. Números são hasheados pelo valor, assim 2 e 2.0 (uma
+    coluna inteira em um bloco que é float em outro) e 0.0 e -0.0 têm o mesmo hash, e valores
+    ausentes têm o mesmo hash qualquer que seja o dtype.
     
-    # 7. Handle inconsistent categories
-    # 7. Tratar categorias inconsistentes
-    def standardize_categories(df):
-        categorical_cols = df.select_dtypes(include=['object', 'category']).columns
+    Args:
+        df (pd.DataFrame): Input DataFrame / DataFrame de entrada
+        
+    Returns:
+        np.ndarray: uint64 hash of each row / Hash uint64 de cada linha
+    """
+    hashes = np.zeros(len(df), dtype=np.uint64)
+    for col in range(df.shape[1]):
+        column = df.iloc[:, col]
+        if pd.api.types.is_integer_dtype(column):
+            column_hashes = pd.util.hash_array(column.to_numpy(dtype=np.int64, na_value=0))
+        elif pd.api.types.is_float_dtype(column):
+            # Integral floats are hashed as integers; adding 0.0 turns -0.0 into 0.0
+            # Floats inteiros são hasheados como inteiros; somar 0.0 transforma -0.0 em 0.0
+            values = column.to_numpy(dtype=np.float64, na_value=np.nan) + 0.0
+            integral = (np.trunc(values) == values) & (np.abs(values) < 2.0 ** 63)
+            column_hashes = pd.util.hash_array(values)
+            column_hashes[integral] = pd.util.hash_array(values[integral].astype(np.int64))
+        else:
+            column_hashes = pd.util.hash_pandas_object(column, index=False).to_numpy()
+        # Missing values get the hash pandas gives to None (the integer 0 hashes to 0)
+        # Valores ausentes recebem o hash que o pandas dá a None (o inteiro 0 tem hash 0)
+        column_hashes = np.where(column.isna().to_numpy(), np.uint64(0xFFFFFFFFFFFFFFFF), column_hashes)
         
-        for col in categorical_cols:
-            # Get value counts
-            # Obter contagem de valores
-            value_counts = df[col].value_counts()
+        # FNV-style combination: the row hash depends on the order of the columns
+        # Combinação no estilo FNV: o hash da linha depende da ordem das colunas
+        hashes = (hashes ^ column_hashes) * np.uint64(0x100000001B3)
+    return hashes
+
+class _ChunkStats:
+    """
+    Accumulates, chunk by chunk, the whole-dataset statistics clean_dataframe needs: missing
+    percentages, numeric medians and IQR bounds and category counts. Medians and quantiles are
+    estimated from a fixed-size uniform sample (reservoir sampling) of each numeric column, so
+    their memory stays bounded; they are exact while a column has at most `sample_size` values.
+    Category and date counts keep one entry per distinct value.
+    
+    The kind of each column (numeric, date, text...) is decided on the first chunk where it has
+    values and every chunk is converted to it, so a column that is empty (float) in one chunk and
+    text in the next still gets a single type. As in clean_dataframe the conversion is all or
+    nothing: when a later chunk doesn't parse (e.g. a stray 'n/a' in a numeric column) the column
+    becomes text and `demoted` tells the caller to collect the statistics again.
+    
+    [PT-BR]
+    Acumula, bloco a bloco, as estatísticas do conjunto inteiro que o clean_dataframe precisa:
+    porcentagens de ausentes, medianas e limites IQR numéricos e contagens de categorias. Medianas
+    e quantis são estimados a partir de uma amostra uniforme de tamanho fixo (reservoir sampling)
+    de cada coluna numérica, assim sua memória fica limitada; são exatos enquanto a coluna tiver no
+    máximo `sample_size` valores. Contagens de categorias e datas mantêm uma entrada por valor distinto.
+    
+    O tipo de cada coluna (numérica, data, texto...) é decidido no primeiro bloco em que ela tem
+    valores e todos os blocos são convertidos para ele, assim uma coluna vazia (float) em um bloco
+    e de texto no seguinte ainda tem um único tipo. Como no clean_dataframe a conversão é tudo ou
+    nada: quando um bloco posterior não é convertido (ex.: um 'n/a' perdido em uma coluna numérica)
+    a coluna vira texto e `demoted` indica a quem chama que as estatísticas devem ser coletadas de novo.
+    """
+    
+    def __init__(self, sample_size: int = 100_000, sparse_threshold: float = 0.7, seed: int = 0, kinds: dict = None):
+        self.sample_size = sample_size
+        self.sparse_threshold = sparse_threshold
+        self.rng = np.random.default_rng(seed)
+        self.kinds = dict(kinds or {})
+        self.demoted = False
+        self.columns = None
+        self.rows = 0
+        self.samples = {}
+        self.sampled = {}
+        self.minimum = {}
+        self.maximum = {}
+        self.integer = {}
+        self.counts = {}
+    
+    def prepare(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Converts a chunk to the kinds of the dataset columns, deciding the kind of the columns
+        that have values for the first time, so all chunks share one schema.
+        
+        [PT-BR]
+        Converte um bloco para os tipos das colunas do conjunto, decidindo o tipo das colunas que
+        têm valores pela primeira vez, assim todos os blocos compartilham um mesmo schema.
+        """
+        for col in chunk.columns:
+            if col not in self.kinds and chunk[col].notna().any():
+                self.kinds[col] = _column_kind(chunk[col])
+        
+        for col in chunk.columns:
+            column, kind = chunk[col], self.kinds.get(col)
+            converted = (
+                (kind == 'numeric' and pd.api.types.is_numeric_dtype(column))
+                or (kind == 'datetime' and pd.api.types.is_datetime64_any_dtype(column))
+                or (kind == 'boolean' and isinstance(column.dtype, pd.BooleanDtype))
+            )
+            if kind in ('numeric', 'datetime', 'boolean') and not converted:
+                parsed = _parse_column(column, kind)
+                if parsed is None:
+                    self.kinds[col] = kind = 'text'
+                    self.demoted = True
+                else:
+                    chunk[col] = parsed
+            if kind == 'text' and not (column.dtype == object or isinstance(column.dtype, pd.StringDtype)):
+                chunk[col] = column.astype(object)
+        return chunk
+    
+    def update(self, chunk: pd.DataFrame) -> None:
+        """
+        Adds a prepared, deduplicated chunk to the statistics (first pass).
+        
+        [PT-BR]
+        Adiciona um bloco preparado e sem duplicatas às estatísticas (primeira passada).
+        """
+        if self.columns is None:
+            self.columns = chunk.columns
+            self.null_counts = pd.Series(0, index=self.columns)
+        
+        self.rows += len(chunk)
+        self.null_counts += chunk[self.columns].isna().sum()
+        
+        for col in self.columns:
+            kind = self.kinds.get(col)
+            if kind == 'numeric':
+                column = chunk[col]
+                self.integer[col] = self.integer.get(col, True) and pd.api.types.is_integer_dtype(column)
+                values = column.to_numpy(dtype=np.float64, na_value=np.nan)
+                self.minimum[col] = np.fmin.reduce(values, initial=self.minimum.get(col, np.nan))
+                self.maximum[col] = np.fmax.reduce(values, initial=self.maximum.get(col, np.nan))
+                self._sample(col, values[~np.isnan(values)])
+            elif kind in ('text', 'category', 'datetime', 'boolean'):
+                self.counts.setdefault(col, Counter()).update(chunk[col].value_counts().to_dict())
+    
+    def _sample(self, col, values: np.ndarray) -> None:
+        # Reservoir sampling (Algorithm R), vectorized over the values of one chunk
+        # Reservoir sampling (Algoritmo R), vetorizado sobre os valores de um bloco
+        sample, seen = self.samples.get(col, np.empty(0)), self.sampled.get(col, 0)
+        room = self.sample_size - len(sample)
+        if room > 0:
+            sample = np.concatenate([sample, values[:room]])
+            seen += len(values[:room])
+            values = values[room:]
+        if len(values) > 0:
+            slots = self.rng.integers(0, seen + np.arange(1, len(values) + 1))
+            replace = slots < self.sample_size
+            sample[slots[replace]] = values[replace]
+            seen += len(values)
+        self.samples[col], self.sampled[col] = sample, seen
+    
+    def finalize(self) -> None:
+        """
+        Derives the column groups, fill values, IQR bounds and category counts from the accumulated statistics.
+        
+        [PT-BR]
+        Deriva os grupos de colunas, valores de preenchimento, limites IQR e contagens de categorias das estatísticas acumuladas.
+        """
+        # Remove columns with high percentage of missing values
+        # Remover colunas com alta porcentagem de valores ausentes
+        missing_percentages = self.null_counts / max(self.rows, 1)
+        keep = missing_percentages <= self.sparse_threshold
+        self.columns = self.columns[keep.to_numpy()]
+        
+        # Column groups, as selected by dtype in clean_dataframe
+        # Grupos de colunas, como selecionados pelo dtype no clean_dataframe
+        def columns_of(*kinds):
+            return pd.Index([col for col in self.columns if self.kinds.get(col) in kinds], dtype=self.columns.dtype)
+        
+        self.numeric_cols = columns_of('numeric')
+        self.categorical_cols = columns_of('text', 'category')
+        self.text_cols = columns_of('text')
+        self.mode_cols = self.categorical_cols.append(columns_of('datetime', 'boolean'))
+        
+        # Median and IQR bounds of every numeric column; as in clean_dataframe the quartiles are
+        # taken from the median-filled column, so the sample gets its share of filled values
+        # Mediana e limites IQR de cada coluna numérica; como no clean_dataframe os quartis são
+        # calculados sobre a coluna preenchida com a mediana, então a amostra recebe sua parte de valores preenchidos
+        self.medians = np.full(len(self.numeric_cols), np.nan)
+        Q1 = np.full(len(self.numeric_cols), np.nan)
+        Q3 = np.full(len(self.numeric_cols), np.nan)
+        for j, col in enumerate(self.numeric_cols):
+            sample = self.samples.get(col, np.empty(0))
+            if len(sample) > 0:
+                self.medians[j] = np.median(sample)
+                filled = round(self.null_counts[col] * len(sample) / self.sampled[col])
+                sample = np.concatenate([sample, np.full(filled, self.medians[j])])
+                Q1[j], Q3[j] = np.percentile(sample, [25, 75])
+        IQR = Q3 - Q1
+        self.lower_bound = Q1 - 1.5 * IQR
+        self.upper_bound = Q3 + 1.5 * IQR
+        
+        # Columns that need filling or capping anywhere in the dataset are rewritten in every chunk,
+        # and so are the columns that are not integer in every chunk, so all chunks get float64
+        # Colunas que precisam de preenchimento ou limite em algum ponto do conjunto são reescritas em
+        # todos os blocos, assim como as colunas que não são inteiras em todos os blocos, assim todos recebem float64
+        minimum = np.array([self.minimum.get(col, np.nan) for col in self.numeric_cols])
+        maximum = np.array([self.maximum.get(col, np.nan) for col in self.numeric_cols])
+        self.numeric_changed = (
+            (self.null_counts[self.numeric_cols].to_numpy() > 0)
+            | (minimum < self.lower_bound)
+            | (maximum > self.upper_bound)
+            | ~np.array([self.integer.get(col, True) for col in self.numeric_cols], dtype=bool)
+        )
+        
+        # Mode of each categorical, date and boolean column, and categorical counts after filling and
+        # text cleaning, which is what the rare category check sees in clean_dataframe
+        # Moda de cada coluna categórica, de data e booleana, e contagens categóricas após preenchimento e
+        # limpeza de texto, que é o que a verificação de categorias raras enxerga no clean_dataframe
+        self.modes = {}
+        self.value_counts = {}
+        for col in self.mode_cols:
+            value_counts = pd.Series(self.counts.get(col, {}), dtype='int64').sort_values(ascending=False)
+            self.modes[col] = _mode_from_counts(value_counts)
+            if col not in self.categorical_cols:
+                continue
+            fill_value = self.modes[col]
+            if col in self.text_cols:
+                # Only the distinct values are cleaned, not every row
+                # Apenas os valores distintos são limpos, não todas as linhas
+                cleaned = _process_text(pd.Series(value_counts.index, dtype=object))
+                value_counts = value_counts.groupby(cleaned.to_numpy()).sum()
+                fill_value = _process_text(pd.Series([fill_value], dtype=object)).iloc[0]
+            value_counts.loc[fill_value] = value_counts.get(fill_value, 0) + self.null_counts[col]
+            self.value_counts[col] = value_counts
+
+class _SeenHashes:
+    """
+    Set of the uint64 hashes of the rows already yielded, kept as sorted runs whose sizes at
+    least double from the last run to the first, like a binary counter. Adding a chunk only merges
+    runs of similar size, so each hash is re-sorted O(log n) times in total instead of once per
+    chunk, and a lookup is a binary search in each of the O(log n) runs.
+    
+    [PT-BR]
+    Conjunto dos hashes uint64 das linhas já geradas, mantido como sequências ordenadas cujos
+    tamanhos pelo menos dobram da última para a primeira, como um contador binário. Adicionar um
+    bloco só junta sequências de tamanho parecido, assim cada hash é reordenado O(log n) vezes no
+    total em vez de uma vez por bloco, e uma busca é uma busca binária em cada uma das O(log n) sequências.
+    """
+    
+    def __init__(self):
+        self.runs = []
+    
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        found = np.zeros(len(hashes), dtype=bool)
+        for run in self.runs:
+            position = np.minimum(np.searchsorted(run, hashes), len(run) - 1)
+            found |= run[position] == hashes
+        return found
+    
+    def add(self, hashes: np.ndarray) -> None:
+        # A stable sort (timsort) of two concatenated sorted runs is a linear merge
+        # Uma ordenação estável (timsort) de duas sequências ordenadas concatenadas é uma junção linear
+        run = np.sort(hashes)
+        while self.runs and len(self.runs[-1]) <= 2 * len(run):
+            run = np.sort(np.concatenate([self.runs.pop(), run]), kind='stable')
+        if len(run) > 0:
+            self.runs.append(run)
+
+def _unique_chunks(
+    chunks: Callable[[], Iterable[pd.DataFrame]],
+    prepare: Callable[[pd.DataFrame], pd.DataFrame]
+) -> Iterator[pd.DataFrame]:
+    """
+    Standardizes the column names of each chunk, converts it with `prepare` and removes duplicate
+    rows, within the chunk and against every previous chunk. Rows are hashed after the conversion,
+    so a row read as int in one chunk and as float in another is still a duplicate. They are
+    compared through a 64-bit hash kept per unique row (8 bytes per unique row, the memory that
+    grows with the dataset), so a hash collision (vanishingly rare) would drop a distinct row.
+    
+    [PT-BR]
+    Padroniza os nomes de colunas de cada bloco, converte-o com `prepare` e remove linhas
+    duplicadas, dentro do bloco e em relação a todos os blocos anteriores. As linhas são hasheadas
+    após a conversão, assim uma linha lida como int em um bloco e como float em outro ainda é uma
+    duplicata. Elas são comparadas por um hash de 64 bits mantido por linha única (8 bytes por linha
+    única, a memória que cresce com o conjunto), assim uma colisão de hash (extremamente rara)
+    descartaria uma linha distinta.
+    """
+    seen_hashes = _SeenHashes()
+    for chunk in chunks():
+        with _copy_on_write():
+            chunk = prepare(standardize_column_names(chunk))
+            hashes = _row_hashes(chunk)
+            keep = ~pd.Series(hashes).duplicated().to_numpy() & ~seen_hashes.contains(hashes)
+            seen_hashes.add(hashes[keep])
+            chunk = chunk[keep]
+        yield chunk
+
+def clean_dataframe_chunked(
+    chunks: Callable[[], Iterable[pd.DataFrame]],
+    sample_size: int = 100_000
+) -> Iterator[pd.DataFrame]:
+    """
+    Performs the clean_dataframe cleaning on a dataset read in chunks, yielding cleaned chunks,
+    so the full rows are never all in memory at once. Besides one chunk, memory is
+    O(unique rows + distinct values): an 8-byte hash per unique row for the deduplication, one
+    count per distinct category or date value and a `sample_size` sample per numeric column.
+    
+    The statistics (missing percentages, medians, IQR bounds, modes and rare categories) describe
+    the whole dataset, so the data is read twice: the first pass collects them and the second
+    applies them to each chunk. Duplicates are removed across chunks by keeping a 64-bit hash per
+    unique row. Data types are not downcast, so every chunk keeps the same schema.
+    
+    [PT-BR]
+    Realiza a limpeza do clean_dataframe em um conjunto lido em blocos, gerando blocos limpos,
+    assim as linhas inteiras nunca estão todas em memória ao mesmo tempo. Além de um bloco, a memória
+    é O(linhas únicas + valores distintos): um hash de 8 bytes por linha única para a remoção de
+    duplicatas, uma contagem por valor distinto de categoria ou data e uma amostra de `sample_size`
+    por coluna numérica.
+    
+    As estatísticas (porcentagens de ausentes, medianas, limites IQR, modas e categorias raras)
+    descrevem o conjunto inteiro, então os dados são lidos duas vezes: a primeira passada as coleta
+    e a segunda as aplica a cada bloco. Duplicatas são removidas entre blocos mantendo um hash de
+    64 bits por linha única. Os tipos de dados não são reduzidos, assim todos os blocos mantêm o mesmo schema.
+    
+    Args:
+        chunks (Callable): Function returning a new iterable of DataFrames on each call /
+                           Função que retorna um novo iterável de DataFrames a cada chamada
+                           Example: lambda: pd.read_sql(query, engine, chunksize=100_000)
+        sample_size (int): Values sampled per numeric column to estimate medians and quantiles /
+                           Valores amostrados por coluna numérica para estimar medianas e quantis
+        
+    Yields:
+        pd.DataFrame: Cleaned chunk / Bloco limpo
+    """
+    # First pass: collect whole-dataset statistics
+    # Primeira passada: coletar estatísticas do conjunto inteiro
+    # Copy-on-Write is enabled per chunk, never while the caller holds a yielded chunk
+    # O Copy-on-Write é habilitado por bloco, nunca enquanto quem chama está com um bloco gerado
+    stats = _ChunkStats(sample_size)
+    while True:
+        for chunk in _unique_chunks(chunks, stats.prepare):
+            if stats.demoted:
+                break
+            with _copy_on_write():
+                stats.update(chunk)
+        if not stats.demoted:
+            break
+        
+        # A column didn't parse in a later chunk and is text after all, so the first pass starts
+        # over with the kinds found so far (at most once per such column)
+        # Uma coluna não foi convertida em um bloco posterior e afinal é texto, então a primeira
+        # passada recomeça com os tipos encontrados até aqui (no máximo uma vez por coluna assim)
+        stats = _ChunkStats(sample_size, kinds=stats.kinds)
+    if stats.columns is None:
+        return
+    stats.finalize()
+    
+    # Second pass: clean each chunk with those statistics
+    # Segunda passada: limpar cada bloco com essas estatísticas
+    for chunk in _unique_chunks(chunks, stats.prepare):
+        with _copy_on_write():
+            chunk = chunk[stats.columns]
             
-            # Find rare categories (less than 1% of data)
-            # Encontrar categorias raras (menos de 1% dos dados)
-            rare_categories = value_counts[value_counts / len(df) < 0.01].index
+            # Handle missing values and outliers in numeric columns
+            # Tratar valores ausentes e outliers em colunas numéricas
+            if stats.numeric_changed.any():
+                values = chunk[stats.numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+                changed = np.zeros(values.shape[1], dtype=bool)
+                _fill_and_clip(values, stats.medians, stats.lower_bound, stats.upper_bound, changed)
+                chunk[stats.numeric_cols[stats.numeric_changed]] = values[:, stats.numeric_changed]
             
-            # Replace rare categories with 'Other'
-            # Substituir categorias raras por 'Other'
-            df[col] = df[col].replace(rare_categories, 'Other')
+            # Fill date and boolean columns with mode
+            # Preencher colunas de data e booleanas com a moda
+            fill_cols = stats.mode_cols.difference(stats.categorical_cols, sort=False)
+            if len(fill_cols) > 0:
+                chunk[fill_cols] = chunk[fill_cols].fillna({col: stats.modes[col] for col in fill_cols})
             
-        return df
-    
-    df_clean = standardize_categories(df_clean)
-    
-    return df_clean
+            # Fill categorical columns with mode, standardize text and handle rare categories
+            # Preencher colunas categóricas com a moda, padronizar texto e tratar categorias raras
+            def clean_column(column):
+                col = column.name
+                column = column.fillna(stats.modes[col])
+                if col in stats.text_cols:
+                    column = _process_text(column)
+                return _replace_rare_categories(column, stats.value_counts[col], stats.rows)
+            
+            for col, values in zip(stats.categorical_cols, _map_columns(clean_column, chunk, stats.categorical_cols)):
+                chunk[col] = values
+            
+        yield chunk
 
-def validate_data(df: pd.DataFrame) -> dict:
+def validate_data(df: pd.DataFrame, value_counts: dict = None) -> dict:
     """
     Validates the cleaned data and returns a summary of the cleaning process
     
@@ -283,15 +1117,28 @@ def validate_data(df: pd.DataFrame) -> dict:
     
     Args:
         df (pd.DataFrame): Cleaned DataFrame / DataFrame limpo
+        value_counts (dict): Value counts returned by clean_dataframe(df, return_stats=True); the
+                             unique values of these columns are taken from them instead of recounted /
+                             Contagens de valores retornadas por clean_dataframe(df, return_stats=True);
+                             os valores únicos dessas colunas são obtidos delas em vez de recontados
         
     Returns:
         dict: Validation summary / Resumo da validação
     """
+    # Columns with known value counts are not hashed again
+    # Colunas com contagens de valores conhecidas não são hasheadas novamente
+    value_counts = value_counts or {}
+    counted = [col for col in df.columns if col in value_counts]
+    unique_values = df.drop(columns=counted).nunique().to_dict()
+    unique_values.update({col: len(value_counts[col]) for col in counted})
+    
+    # Column-wise reductions over the whole frame, no per-column Python loop
+    # Reduções por coluna sobre o frame inteiro, sem loop Python por coluna
     validation_summary = {
         'total_rows': len(df),
-        'missing_values': df.isnull().sum().to_dict(),
-        'data_types': df.dtypes.to_dict(),
-        'unique_values': {col: df[col].nunique() for col in df.columns}
+        'missing_values': (len(df) - df.count()).to_dict(),
+        'data_types': df.dtypes.astype(str).to_dict(),
+        'unique_values': {col: unique_values[col] for col in df.columns}
     }
     
     return validation_summary
@@ -300,19 +1147,37 @@ def validate_data(df: pd.DataFrame) -> dict:
 
 # Example usage:
 if __name__ == "__main__":
-    # Load your data
-    # Carregar seus dados
-    # df = pd.read_csv('your_data.csv')
-    
-    # Clean the data
-    # Limpar os dados
-    # df_cleaned = clean_dataframe(df)
-    
-    # Validate the results
-    # Validar os resultados
-    # validation_results = validate_data(df_cleaned)
-    
-    # Export cleaned data
-    # Exportar dados limpos
-    # df_cleaned.to_csv('cleaned_data.csv', index=False)
-    pass
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Clean a CSV file / Limpar um arquivo CSV")
+    parser.add_argument("input", help="CSV file to clean / Arquivo CSV a ser limpo")
+    parser.add_argument("output", help="Cleaned CSV file / Arquivo CSV limpo")
+    parser.add_argument(
+        "--chunksize", type=int, default=None,
+        help="Rows per chunk; streams the file instead of loading it / "
+             "Linhas por bloco; processa o arquivo em blocos em vez de carregá-lo inteiro"
+    )
+    args = parser.parse_args()
+    
+    if args.chunksize:
+        # Clean the data chunk by chunk (the file is read twice) and export each cleaned chunk
+        # Limpar os dados bloco a bloco (o arquivo é lido duas vezes) e exportar cada bloco limpo
+        cleaned_chunks = clean_dataframe_chunked(lambda: pd.read_csv(args.input, chunksize=args.chunksize))
+        for i, df_chunk in enumerate(cleaned_chunks):
+            df_chunk.to_csv(args.output, mode='w' if i == 0 else 'a', header=i == 0, index=False)
+    else:
+        # Load your data
+        # Carregar seus dados
+        df = pd.read_csv(args.input)
+        
+        # Clean the data, keeping the value counts for the validation
+        # Limpar os dados, mantendo as contagens de valores para a validação
+        df_cleaned, value_counts = clean_dataframe(df, return_stats=True)
+        
+        # Validate the results
+        # Validar os resultados
+        validation_results = validate_data(df_cleaned, value_counts)
+        
+        # Export cleaned data
+        # Exportar dados limpos
+        df_cleaned.to_csv(args.output, index=False)